@@ -1,7 +1,8 @@
-"""Factorial calculator using Binary Splitting or math.factorial wrapper.
+"""Factorial calculator using math.factorial or the Prime Swing algorithm.
 
 This module provides factorial calculation using Python's optimized math.factorial
-and includes binary splitting implementation for benchmarking purposes.
+for small inputs and Luschny's Prime Swing algorithm for large inputs, and
+includes a binary splitting implementation for benchmarking purposes.
 
 Dependencies:
     - math: Standard library for factorial calculation
@@ -24,6 +25,9 @@ from src.core.precision_checker import (
 )
 from src.core.resource_manager import monitor_memory, monitor_timeout
 
+# Above this n the Prime Swing algorithm outperforms math.factorial
+PRIME_SWING_CUTOFF: int = 20000
+
 
 def _product_range(a: int, b: int) -> int:
     """Compute product of integers from a to b using binary splitting.
@@ -86,6 +90,130 @@ def _custom_factorial_simple(n: int) -> int:
     return result
 
 
+# Swing numbers n! / ((n // 2)!)^2 for n < 33 (OEIS A056040)
+_SMALL_SWING: Tuple[int, ...] = (
+    1, 1, 1, 3, 3, 15, 5, 35, 35, 315, 63, 693, 231, 3003, 429, 6435,
+    6435, 109395, 12155, 230945, 46189, 969969, 88179, 2028117, 676039,
+    16900975, 1300075, 35102025, 5014575, 145422675, 9694845, 300540195,
+    300540195,
+)
+
+
+def _primes_up_to(n: int) -> List[int]:
+    """Sieve of Eratosthenes returning all primes <= n.
+
+    :param n: Upper bound (inclusive)
+    :type n: int
+    :return: Sorted list of primes up to n
+    :rtype: List[int]
+    """
+    if n < 2:
+        return []
+
+    sieve = bytearray([1]) * (n + 1)
+    sieve[0] = sieve[1] = 0
+    for i in range(2, math.isqrt(n) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytes(len(range(i * i, n + 1, i)))
+    return [i for i in range(2, n + 1) if sieve[i]]
+
+
+def _product_of(factors: List[int], lo: int, hi: int) -> int:
+    """Multiply factors[lo:hi] by binary splitting (balanced operands).
+
+    :param factors: Factors to multiply
+    :type factors: List[int]
+    :param lo: Start index (inclusive)
+    :type lo: int
+    :param hi: End index (exclusive)
+    :type hi: int
+    :return: Product of the selected factors
+    :rtype: int
+    """
+    if hi - lo <= 8:
+        result = 1
+        for i in range(lo, hi):
+            result *= factors[i]
+        return result
+
+    mid = (lo + hi) // 2
+    return _product_of(factors, lo, mid) * _product_of(factors, mid, hi)
+
+
+def _swing(n: int, primes: List[int]) -> int:
+    """Compute the odd swing number n! / ((n // 2)!)^2 from its primes.
+
+    :param n: Input value
+    :type n: int
+    :param primes: All primes up to at least n
+    :type primes: List[int]
+    :return: Swing number of n
+    :rtype: int
+    """
+    if n < len(_SMALL_SWING):
+        return _SMALL_SWING[n]
+
+    sqrt_n = math.isqrt(n)
+    factors: List[int] = []
+    for prime in primes[1:]:
+        if prime > n:
+            break
+        if prime > n // 2:
+            factors.append(prime)
+        elif prime > sqrt_n:
+            if (n // prime) & 1:
+                factors.append(prime)
+        else:
+            q, power = n, 1
+            while q > 1:
+                q //= prime
+                if q & 1:
+                    power *= prime
+            if power > 1:
+                factors.append(power)
+
+    return _product_of(factors, 0, len(factors))
+
+
+def _odd_factorial(n: int, primes: List[int]) -> int:
+    """Compute the odd part of n! via (n!)_odd = ((n//2)!_odd)^2 * swing(n).
+
+    :param n: Input value
+    :type n: int
+    :param primes: All primes up to at least n
+    :type primes: List[int]
+    :return: n! with all factors of two removed
+    :rtype: int
+    """
+    if n < 2:
+        return 1
+
+    half = _odd_factorial(n // 2, primes)
+    return half * half * _swing(n, primes)
+
+
+def prime_swing_factorial(n: int) -> int:
+    """Prime swing factorial (Luschny) for benchmarking.
+
+    Computes n! = 2^(n - popcount(n)) * (n!)_odd where the odd part is
+    built recursively from swing numbers, whose prime factorisation is
+    known in closed form. Runs in O(M(n log n)).
+
+    :param n: Input value
+    :type n: int
+    :return: n!
+    :rtype: int
+    :raises ValueError: If n is negative
+    """
+    if n < 0:
+        raise ValueError("Factorial not defined for negative numbers")
+    if n < 2:
+        return 1
+
+    odd_part = _odd_factorial(n, _primes_up_to(n))
+    return odd_part << (n - n.bit_count())
+
+
 def _benchmark_single_value(
     n: int, math_func: Any, custom_func: Any
 ) -> Tuple[Tuple[int, float], Tuple[int, float]]:
@@ -171,7 +299,7 @@ def benchmark_factorial_methods(
     """Benchmark math.factorial vs custom implementation.
 
     Runs timing comparisons between math.factorial (C-optimized) and
-    a custom implementation to determine which is faster.
+    the Prime Swing implementation to determine which is faster.
 
     :param input_values: List of input values to benchmark
     :type input_values: List[int]
@@ -183,7 +311,7 @@ def benchmark_factorial_methods(
 
     for n in input_values:
         math_time, custom_time = _benchmark_single_value(
-            n, math.factorial, _binary_splitting_factorial
+            n, math.factorial, prime_swing_factorial
         )
         math_times.append(math_time)
         custom_times.append(custom_time)
@@ -206,16 +334,20 @@ def benchmark_factorial_methods(
 
 
 class FactorialCalculator(Calculator):
-    """Factorial calculator using math.factorial (C-optimized).
+    """Factorial calculator using math.factorial and Prime Swing.
 
-    Uses Python's built-in math.factorial which is C-optimized in CPython
-    and provides excellent performance for large factorials.
+    Uses Python's built-in math.factorial (C-optimized) for small inputs
+    and switches to the asymptotically faster Prime Swing algorithm from
+    PRIME_SWING_CUTOFF onwards.
     """
 
     @monitor_memory
     @monitor_timeout
     def calculate_by_index(self, n: int) -> int:
-        """Calculate n! (n factorial) using math.factorial.
+        """Calculate n! (n factorial).
+
+        Uses math.factorial below PRIME_SWING_CUTOFF and the Prime Swing
+        algorithm above it.
 
         :param n: Input value (must be non-negative integer)
         :type n: int
@@ -230,7 +362,11 @@ class FactorialCalculator(Calculator):
                 f"Factorial is not defined for negative numbers, got {n}"
             )
 
-        result = math.factorial(n)
+        result = (
+            prime_swing_factorial(n)
+            if n >= PRIME_SWING_CUTOFF
+            else math.factorial(n)
+        )
         check_precision(result, "Factorial calculation")
         return result
 
@@ -48,23 +48,22 @@ from src.core.exceptions import (
     TimeoutError as CalculationTimeoutError,
 )
 
-# Set int max str digits to handle large numbers (10,000+ digits as per spec)
-# Default limit is 4300, we need at least 10,000
-# Set to 1,000,000 to handle extremely large numbers
-sys.set_int_max_str_digits(1000000)
-
 app = typer.Typer()
 
 # Module-level constants
 DEFAULT_MAX_DISPLAY_CHARS = 1000
 MEMORY_UNIT_MB = 1024 * 1024
 HALF_DISPLAY = DEFAULT_MAX_DISPLAY_CHARS // 2
+# Default limit is 4300, we need at least 10,000 (spec); 1,000,000
+# handles extremely large numbers
+INT_MAX_STR_DIGITS = 1000000
 
 # Benchmark input values by calculator type
 BENCHMARK_INPUTS: Dict[str, Dict[str, List[int]]] = {
     "primes": {
         "by_index": [100, 500, 1000, 2000, 5000],
-        "by_digits": [2, 3, 4, 5, 6],
+        # Below 19 digits the answer comes from a lookup table
+        "by_digits": [20, 30, 40, 50, 60],
     },
     "fibonacci": {
         "by_index": [100, 500, 1000, 2000, 5000],
@@ -77,6 +76,18 @@ BENCHMARK_INPUTS: Dict[str, Dict[str, List[int]]] = {
 }
 
 
+def configure_int_max_str_digits() -> None:
+    """Raise the int-to-str conversion limit for large results.
+
+    Called once at import so results with 10,000+ digits (as per spec)
+    can be printed and written to file.
+    """
+    sys.set_int_max_str_digits(INT_MAX_STR_DIGITS)
+
+
+configure_int_max_str_digits()
+
+
 def handle_calculation_errors(func: Callable) -> Callable:
     """Decorator to handle calculator errors uniformly.
 
@@ -158,7 +169,9 @@ class CalculationRequest:
 
 
 def _validate_inputs(
-    index: Optional[int], min_digits: Optional[int]
+    index: Optional[int],
+    min_digits: Optional[int],
+    index_list: Optional[str] = None,
 ) -> None:
     """Validate CLI input arguments.
 
@@ -166,19 +179,26 @@ def _validate_inputs(
     :type index: Optional[int]
     :param min_digits: Minimum digits value if provided
     :type min_digits: Optional[int]
+    :param index_list: Comma-separated index list if provided
+    :type index_list: Optional[str]
     :raises typer.Exit: If validation fails
     """
-    if index is not None and min_digits is not None:
+    provided = [
+        value for value in (index, min_digits, index_list)
+        if value is not None
+    ]
+    if len(provided) > 1:
         typer.echo(
-            "Error: --index and --min-digits are mutually exclusive. "
-            "Use only one.",
+            "Error: --index, --index-list and --min-digits are mutually "
+            "exclusive. Use only one.",
             err=True,
         )
         raise typer.Exit(code=1)
 
-    if index is None and min_digits is None:
+    if not provided:
         typer.echo(
-            "Error: Either --index or --min-digits must be provided.",
+            "Error: Either --index, --index-list or --min-digits must be "
+            "provided.",
             err=True,
         )
         raise typer.Exit(code=1)
@@ -198,6 +218,56 @@ def _validate_inputs(
         raise typer.Exit(code=1)
 
 
+def _parse_index_list(index_list: str) -> List[int]:
+    """Parse the comma-separated value of --index-list.
+
+    :param index_list: Comma-separated indices (e.g. "100,1000,100000")
+    :type index_list: str
+    :return: Parsed indices in the order given
+    :rtype: List[int]
+    :raises typer.Exit: If an entry is not a non-negative integer
+    """
+    try:
+        indices = [
+            int(part) for part in index_list.split(",") if part.strip()
+        ]
+    except ValueError:
+        indices = []
+
+    if not indices or any(i < 0 for i in indices):
+        typer.echo(
+            "Error: --index-list must be a comma-separated list of "
+            "non-negative integers.",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+    return indices
+
+
+def _collect_input_values(
+    index: Optional[int],
+    min_digits: Optional[int],
+    index_list: Optional[str],
+) -> List[int]:
+    """Collect the input values to calculate from validated CLI options.
+
+    :param index: Index value if provided
+    :type index: Optional[int]
+    :param min_digits: Minimum digits value if provided
+    :type min_digits: Optional[int]
+    :param index_list: Comma-separated index list if provided
+    :type index_list: Optional[str]
+    :return: Input values, one per calculation
+    :rtype: List[int]
+    """
+    if index_list is not None:
+        return _parse_index_list(index_list)
+    if index is not None:
+        return [index]
+    return [min_digits] if min_digits is not None else []
+
+
 def _initialize_calculator(
     calculator_type: CalculatorType,
 ) -> Tuple[Any, str, str]:
@@ -520,6 +590,82 @@ def _run_estimation_workflow(
     )
 
 
+def _build_estimation_context(
+    calc_type_str: str,
+    request: CalculationRequest,
+    benchmark: bool,
+    dry_run: bool,
+    strict: bool,
+) -> EstimationContext:
+    """Build the estimation context for a single calculation request.
+
+    :param calc_type_str: Calculator type string
+    :type calc_type_str: str
+    :param request: Calculation request parameters
+    :type request: CalculationRequest
+    :param benchmark: Whether benchmark flag is set
+    :type benchmark: bool
+    :param dry_run: Whether dry-run flag is set
+    :type dry_run: bool
+    :param strict: Whether strict flag is set
+    :type strict: bool
+    :return: Estimation context for the request
+    :rtype: EstimationContext
+    """
+    estimated_digits = estimate_digit_count(
+        calc_type_str, request.input_value, request.use_by_index
+    )
+    return EstimationContext(
+        needs_automatic_estimation=(
+            estimated_digits > LARGE_DIGIT_THRESHOLD
+        ),
+        estimated_digits=estimated_digits,
+        benchmark=benchmark,
+        dry_run=dry_run,
+        strict=strict,
+    )
+
+
+def _run_calculation_request(
+    estimator: Estimator,
+    calculator: Any,
+    request: CalculationRequest,
+    context: EstimationContext,
+    calc_type_str: str,
+) -> None:
+    """Estimate (if needed) and execute a single calculation request.
+
+    The estimator is shared between requests of one invocation, so the
+    micro-benchmark runs at most once per calculator type.
+
+    :param estimator: Estimator instance
+    :type estimator: Estimator
+    :param calculator: Calculator instance
+    :type calculator: Any
+    :param request: Calculation request parameters
+    :type request: CalculationRequest
+    :param context: Estimation context with flags
+    :type context: EstimationContext
+    :param calc_type_str: Calculator type string
+    :type calc_type_str: str
+    :raises typer.Exit: On strict abort or calculation error
+    """
+    if _should_run_estimation(
+        context.benchmark,
+        context.dry_run,
+        context.needs_automatic_estimation,
+    ):
+        _run_estimation_workflow(estimator, calculator, request, context)
+
+        if context.dry_run:
+            typer.echo("Dry run: No calculation performed.")
+            return
+
+    _execute_calculation(
+        calculator, request.input_value, request.use_by_index, calc_type_str
+    )
+
+
 @app.command()
 def main(  # pylint: disable=too-many-arguments,too-many-locals,too-many-positional-arguments
     calculator_type: CalculatorType = typer.Argument(
@@ -534,6 +680,11 @@ def main(  # pylint: disable=too-many-arguments,too-many-locals,too-many-positio
         "-d",
         help="Calculate by minimum digits",
     ),
+    index_list: Optional[str] = typer.Option(
+        None,
+        "--index-list",
+        help="Calculate several indices in one run (comma-separated)",
+    ),
     benchmark: bool = typer.Option(
         False, "--benchmark", help="Run estimation benchmark"
     ),
@@ -554,6 +705,7 @@ def main(  # pylint: disable=too-many-arguments,too-many-locals,too-many-positio
         py_mega_calc fib --index 100
         py_mega_calc prime --min-digits 10
         py_mega_calc fact --index 50 --benchmark
+        py_mega_calc fib --index-list 100,1000,100000
 
     :param calculator_type: Type of calculator to use
     :type calculator_type: CalculatorType
@@ -561,6 +713,8 @@ def main(  # pylint: disable=too-many-arguments,too-many-locals,too-many-positio
     :type index: Optional[int]
     :param min_digits: Minimum number of digits
     :type min_digits: Optional[int]
+    :param index_list: Comma-separated indices to calculate in one run
+    :type index_list: Optional[str]
     :param benchmark: Whether to run benchmark
     :type benchmark: bool
     :param dry_run: Whether to only estimate (no calculation)
@@ -568,52 +722,29 @@ def main(  # pylint: disable=too-many-arguments,too-many-locals,too-many-positio
     :param strict: Whether to abort if time exceeds limit
     :type strict: bool
     """
-    _validate_inputs(index, min_digits)
+    _validate_inputs(index, min_digits, index_list)
+    input_values = _collect_input_values(index, min_digits, index_list)
 
     calculator, calc_type_str, estimator_calc_type = (
         _initialize_calculator(calculator_type)
     )
+    estimator = Estimator()
 
-    input_value = index if index is not None else min_digits
-    use_by_index = index is not None
+    for input_value in input_values:
+        if index_list is not None:
+            typer.echo(f"\n=== Index {input_value} ===")
 
-    estimated_digits = estimate_digit_count(
-        calc_type_str, input_value, use_by_index
-    )
-    needs_automatic_estimation = (
-        estimated_digits > LARGE_DIGIT_THRESHOLD
-    )
-
-    context = EstimationContext(
-        needs_automatic_estimation=needs_automatic_estimation,
-        estimated_digits=estimated_digits,
-        benchmark=benchmark,
-        dry_run=dry_run,
-        strict=strict,
-    )
-
-    request = CalculationRequest(
-        input_value=input_value,
-        estimator_calc_type=estimator_calc_type,
-        use_by_index=use_by_index,
-    )
-
-    if _should_run_estimation(benchmark, dry_run, needs_automatic_estimation):
-        estimator = Estimator()
-        _run_estimation_workflow(
-            estimator,
-            calculator,
-            request,
-            context,
+        request = CalculationRequest(
+            input_value=input_value,
+            estimator_calc_type=estimator_calc_type,
+            use_by_index=min_digits is None,
+        )
+        context = _build_estimation_context(
+            calc_type_str, request, benchmark, dry_run, strict
+        )
+        _run_calculation_request(
+            estimator, calculator, request, context, calc_type_str
         )
-
-        if dry_run:
-            typer.echo("Dry run: No calculation performed.")
-            return
-
-    _execute_calculation(
-        calculator, input_value, use_by_index, calc_type_str
-    )
 
 
 def format_result(
@@ -657,6 +788,32 @@ def format_metadata(execution_time: float, ram_usage_mb: float) -> str:
     )
 
 
+def _unique_result_path(output_dir: str, stem: str) -> str:
+    """Reserve a result file path that does not overwrite an earlier result.
+
+    Several results of one invocation (e.g. --index-list), or of parallel
+    processes, can share the same second-resolution timestamp, so a counter
+    suffix is appended when needed. The file is created exclusively to
+    make the reservation atomic.
+
+    :param output_dir: Output directory
+    :type output_dir: str
+    :param stem: File name without extension
+    :type stem: str
+    :return: Path to a newly created, empty result file
+    :rtype: str
+    """
+    counter = 0
+    while True:
+        suffix = f"_{counter}" if counter else ""
+        filepath = os.path.join(output_dir, f"{stem}{suffix}.txt")
+        try:
+            with open(filepath, 'x', encoding='utf-8'):
+                return filepath
+        except FileExistsError:
+            counter += 1
+
+
 def write_result_to_file(
     result: int,
     calc_type: str,
@@ -682,8 +839,7 @@ def write_result_to_file(
     Path(output_dir).mkdir(parents=True, exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{timestamp}_{calc_type}.txt"
-    filepath = os.path.join(output_dir, filename)
+    filepath = _unique_result_path(output_dir, f"{timestamp}_{calc_type}")
 
     with open(filepath, 'w', encoding='utf-8') as f:
         f.write("Calculation Result\n")
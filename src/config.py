@@ -11,6 +11,8 @@ Dependencies:
 MAX_MEMORY_GB: int = 24
 MAX_MEMORY_BYTES: int = MAX_MEMORY_GB * 1024 * 1024 * 1024
 MAX_TIME_SECONDS: int = 300  # 5 minutes
+# Interval between memory checks while a monitored calculation runs
+MEMORY_SAMPLE_SECONDS: float = 1.0
 
 # Output settings
 MAX_DISPLAY_CHARS: int = 1000
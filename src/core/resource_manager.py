@@ -5,37 +5,98 @@ raising appropriate exceptions when resource limits are exceeded.
 
 Dependencies:
     - functools: Function wrapping utilities
+    - os: Page size lookup for reading /proc/self/statm, current pid
     - psutil: System and process utilities
-    - time: Time measurement
+    - signal: SIGALRM interval timer for main-thread timeouts
+    - time: Monotonic clock for deadlines and elapsed-time checks
     - threading: Thread management for timeout monitoring
     - src.core.exceptions: ResourceExhaustedError, TimeoutError
-    - src.config: MAX_MEMORY_BYTES, MAX_TIME_SECONDS constants
+    - src.config: MAX_MEMORY_BYTES, MAX_TIME_SECONDS,
+      MEMORY_SAMPLE_SECONDS constants
 """
 
 import functools
+import os
+import signal
 import threading
 import time
 from typing import Any, Callable
 
 import psutil
 
-from src.config import MAX_MEMORY_BYTES, MAX_TIME_SECONDS
+from src.config import (
+    MAX_MEMORY_BYTES,
+    MAX_TIME_SECONDS,
+    MEMORY_SAMPLE_SECONDS,
+)
 from src.core.exceptions import (
     ResourceExhaustedError,
     TimeoutError as CalculationTimeoutError,
 )
 
+_STATM_PATH = "/proc/self/statm"
+
+
+@functools.lru_cache(maxsize=1)
+def _process(pid: int) -> psutil.Process:
+    """Return a psutil handle for pid, created once per process.
+
+    Keyed on the pid so that a forked child builds its own handle
+    instead of reporting the parent's memory.
+
+    :param pid: Id of the current process
+    :type pid: int
+    :return: Cached process handle
+    :rtype: psutil.Process
+    """
+    return psutil.Process(pid)
+
+
+def _page_size() -> int:
+    """Return the page size used by /proc/self/statm.
+
+    :return: Page size in bytes, or 0 when it cannot be determined
+    :rtype: int
+    """
+    try:
+        size = os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return 0
+    return size if size > 0 else 0
+
+
+_PAGE_SIZE: int = _page_size()
+# Linux exposes RSS in pages as the second field of /proc/self/statm
+_HAS_STATM: bool = _PAGE_SIZE > 0 and os.path.exists(_STATM_PATH)
+
+
+def _rss_bytes() -> int:
+    """Return the resident set size of the current process.
+
+    Reads /proc/self/statm directly where available and falls back to
+    psutil on other platforms.
+
+    :return: Resident set size in bytes
+    :rtype: int
+    """
+    if _HAS_STATM:
+        fd = os.open(_STATM_PATH, os.O_RDONLY)
+        try:
+            return int(os.read(fd, 128).split()[1]) * _PAGE_SIZE
+        finally:
+            os.close(fd)
+    return _process(os.getpid()).memory_info().rss
+
 
 def _check_memory_limit() -> None:
     """Check if current memory usage exceeds limit.
 
     :raises ResourceExhaustedError: If memory usage exceeds 24GB limit
     """
-    process = psutil.Process()
-    memory_info = process.memory_info()
+    rss = _rss_bytes()
 
-    if memory_info.rss > MAX_MEMORY_BYTES:
-        usage_gb = memory_info.rss / (1024 ** 3)
+    if rss > MAX_MEMORY_BYTES:
+        usage_gb = rss / (1024 ** 3)
         raise ResourceExhaustedError(
             f"Memory limit of 24GB exceeded. "
             f"Current usage: {usage_gb:.2f}GB"
@@ -45,9 +106,10 @@ def _check_memory_limit() -> None:
 def monitor_memory(func: Callable) -> Callable:
     """Decorator to monitor memory usage.
 
-    Checks memory usage before and after function execution.
-    Raises ResourceExhaustedError if memory usage exceeds MAX_MEMORY_BYTES
-    (24GB).
+    Checks memory usage once, after function execution. Long-running
+    calculations that are also wrapped with monitor_timeout are sampled
+    while they run as well. Raises ResourceExhaustedError if memory usage
+    exceeds MAX_MEMORY_BYTES (24GB).
 
     :param func: The function to monitor
     :type func: Callable
@@ -57,7 +119,6 @@ def monitor_memory(func: Callable) -> Callable:
     """
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        _check_memory_limit()
         result = func(*args, **kwargs)
         _check_memory_limit()
         return result
@@ -65,11 +126,86 @@ def monitor_memory(func: Callable) -> Callable:
     return wrapper
 
 
-def _run_with_timeout(
+_ALARM_SUPPORTED: bool = hasattr(signal, "setitimer")
+# Set while a monitored call in the main thread owns ITIMER_REAL
+_alarm_state: dict[str, bool] = {'active': False}
+
+
+def _timeout_error() -> CalculationTimeoutError:
+    """Build the error raised when a calculation runs out of time.
+
+    :return: Timeout error describing the MAX_TIME_SECONDS limit
+    :rtype: CalculationTimeoutError
+    """
+    return CalculationTimeoutError(
+        f"Calculation exceeded {MAX_TIME_SECONDS} second "
+        f"({MAX_TIME_SECONDS // 60} minute) timeout."
+    )
+
+
+def _run_with_alarm(
+    func: Callable, args: tuple, kwargs: dict, timeout: float
+) -> Any:
+    """Run function in the main thread under a SIGALRM interval timer.
+
+    ITIMER_REAL fires every MEMORY_SAMPLE_SECONDS. Each tick samples
+    memory usage, and the first tick at or past the deadline raises
+    CalculationTimeoutError inside the calculation itself, so it stops
+    instead of running on unobserved. The deadline is measured on the
+    monotonic clock rather than by counting ticks, because ticks that
+    expire during one long C-level step are merged into a single signal.
+    Calls that finish within the first interval never see a tick.
+
+    :param func: Function to execute
+    :type func: Callable
+    :param args: Positional arguments
+    :type args: tuple
+    :param kwargs: Keyword arguments
+    :type kwargs: dict
+    :param timeout: Timeout in seconds
+    :type timeout: float
+    :return: Function result
+    :rtype: Any
+    :raises CalculationTimeoutError: If execution exceeds timeout
+    :raises ResourceExhaustedError: If a sample exceeds the memory limit
+    :raises Exception: Any exception raised by the function
+    """
+    interval = min(MEMORY_SAMPLE_SECONDS, timeout)
+    state: dict[str, bool] = {'done': False}
+
+    def on_alarm(_signum: int, _frame: Any) -> None:
+        if state['done']:
+            return
+        if time.monotonic() >= deadline:
+            raise _timeout_error()
+        _check_memory_limit()
+
+    previous = signal.signal(signal.SIGALRM, on_alarm)
+    _alarm_state['active'] = True
+    deadline = time.monotonic() + timeout
+    signal.setitimer(signal.ITIMER_REAL, interval, interval)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        state['done'] = True
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        _alarm_state['active'] = False
+        signal.signal(
+            signal.SIGALRM,
+            previous if previous is not None else signal.SIG_DFL,
+        )
+
+
+def _run_in_thread(
     func: Callable, args: tuple, kwargs: dict, timeout: float
 ) -> Any:
     """Run function in a thread with timeout monitoring.
 
+    While waiting for the thread, memory usage is sampled every
+    MEMORY_SAMPLE_SECONDS so runaway allocations are caught before the
+    calculation returns. Calls that finish within the first interval are
+    never sampled.
+
     :param func: Function to execute
     :type func: Callable
     :param args: Positional arguments
@@ -81,6 +217,7 @@ def _run_with_timeout(
     :return: Function result
     :rtype: Any
     :raises CalculationTimeoutError: If execution exceeds timeout
+    :raises ResourceExhaustedError: If a sample exceeds the memory limit
     :raises Exception: Any exception raised by the function
     """
     result_container: dict[str, Any] = {
@@ -99,13 +236,16 @@ def _run_with_timeout(
     thread = threading.Thread(target=target)
     thread.daemon = True
     thread.start()
-    thread.join(timeout=timeout)
+    remaining = timeout
+    while remaining > 0:
+        thread.join(timeout=min(MEMORY_SAMPLE_SECONDS, remaining))
+        if not thread.is_alive():
+            break
+        _check_memory_limit()
+        remaining -= MEMORY_SAMPLE_SECONDS
 
     if thread.is_alive():
-        raise CalculationTimeoutError(
-            f"Calculation exceeded {MAX_TIME_SECONDS} second "
-            f"({MAX_TIME_SECONDS // 60} minute) timeout."
-        )
+        raise _timeout_error()
 
     exception = result_container['exception']
     if exception is not None:
@@ -114,6 +254,43 @@ def _run_with_timeout(
     return result_container['value']
 
 
+def _run_with_timeout(
+    func: Callable, args: tuple, kwargs: dict, timeout: float
+) -> Any:
+    """Run function with timeout and memory-sampling enforcement.
+
+    The main thread uses a SIGALRM interval timer when the platform has
+    one and ITIMER_REAL is free. A call nested inside another monitored
+    call runs directly, because the outer timer already covers it. Other
+    threads, and platforms without setitimer, fall back to a worker
+    thread.
+
+    :param func: Function to execute
+    :type func: Callable
+    :param args: Positional arguments
+    :type args: tuple
+    :param kwargs: Keyword arguments
+    :type kwargs: dict
+    :param timeout: Timeout in seconds
+    :type timeout: float
+    :return: Function result
+    :rtype: Any
+    :raises CalculationTimeoutError: If execution exceeds timeout
+    :raises ResourceExhaustedError: If a sample exceeds the memory limit
+    :raises Exception: Any exception raised by the function
+    """
+    if (
+        not _ALARM_SUPPORTED
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        return _run_in_thread(func, args, kwargs, timeout)
+    if _alarm_state['active']:
+        return func(*args, **kwargs)
+    if signal.getitimer(signal.ITIMER_REAL) != (0.0, 0.0):
+        return _run_in_thread(func, args, kwargs, timeout)
+    return _run_with_alarm(func, args, kwargs, timeout)
+
+
 def monitor_timeout(func: Callable) -> Callable:
     """Decorator to monitor execution time.
 
@@ -128,15 +305,15 @@ def monitor_timeout(func: Callable) -> Callable:
     """
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         result = _run_with_timeout(func, args, kwargs, MAX_TIME_SECONDS)
-        elapsed_time = time.time() - start_time
+        elapsed_ns = time.monotonic_ns() - start_ns
 
-        if elapsed_time > MAX_TIME_SECONDS:
+        if elapsed_ns > MAX_TIME_SECONDS * 1_000_000_000:
             raise CalculationTimeoutError(
                 f"Calculation exceeded {MAX_TIME_SECONDS} second "
                 f"({MAX_TIME_SECONDS // 60} minute) timeout. "
-                f"Elapsed time: {elapsed_time:.2f} seconds"
+                f"Elapsed time: {elapsed_ns / 1e9:.2f} seconds"
             )
 
         return result
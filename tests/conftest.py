@@ -4,5 +4,165 @@ This module provides shared pytest fixtures and configuration for all
 test modules.
 
 Dependencies:
+    - os: Switching the working directory for the session
     - pytest: Testing framework
+    - sys: System-specific parameters
+    - typing: Type hints
+    - typer.testing: CLI testing utilities
+    - unittest.mock: Stubbing the estimator benchmark and RSS reader
+    - src.calculators.primes: PrimeCalculator class
+    - src.cli: CLI application
+    - src.config: MAX_MEMORY_BYTES constant
+    - src.core.estimator: Estimator class
 """
+
+import os
+import sys
+from typing import Callable, Dict, Iterator, Sequence, Tuple
+from unittest.mock import Mock, patch
+
+import pytest
+from typer.testing import CliRunner, Result
+
+from src.calculators.primes import PrimeCalculator
+from src.cli import app
+from src.config import MAX_MEMORY_BYTES
+from src.core.estimator import Estimator
+
+# Type of the invoke fixture, shared by the CLI test modules
+CliInvoke = Callable[[Sequence[str]], Result]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_working_directory(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Iterator[None]:
+    """Run the whole session inside a temporary working directory.
+
+    The CLI writes every result to ``results/`` under the working
+    directory, with a unique name per file, so tests run from the
+    repository would otherwise leave new files in the tracked folder.
+
+    :param tmp_path_factory: Session-scoped temporary path factory
+    :type tmp_path_factory: pytest.TempPathFactory
+    :return: Iterator yielding once the directory has been switched
+    :rtype: Iterator[None]
+    """
+    original = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("cwd"))
+    yield
+    os.chdir(original)
+
+
+@pytest.fixture(scope="session", name="runner")
+def fixture_runner() -> CliRunner:
+    """Provide a CliRunner shared by all tests.
+
+    :return: CLI test runner
+    :rtype: CliRunner
+    """
+    return CliRunner()
+
+
+@pytest.fixture(scope="session", name="invoke")
+def fixture_invoke(runner: CliRunner) -> CliInvoke:
+    """Provide a memoized CLI invocation keyed by argv.
+
+    Identical argv lists run the CLI only once per session. Tests that
+    depend on patched or mutated global state must use ``runner`` directly.
+
+    :param runner: Shared CLI test runner
+    :type runner: CliRunner
+    :return: Function invoking the CLI app with the given arguments
+    :rtype: CliInvoke
+    """
+    cache: Dict[Tuple[str, ...], Result] = {}
+
+    def _invoke(args: Sequence[str]) -> Result:
+        key = tuple(args)
+        if key not in cache:
+            cache[key] = runner.invoke(app, list(key))
+        return cache[key]
+
+    return _invoke
+
+
+@pytest.fixture(scope="session")
+def benchmark_dryrun_result(runner: CliRunner) -> Result:
+    """Provide the result of one ``--benchmark --dry-run`` invocation.
+
+    Shared by the tests asserting estimation and dry-run output.
+    Estimator.run_micro_benchmark is stubbed with canned timings so no
+    real benchmark runs, and the stub must be requested exactly once.
+    The invocation bypasses ``invoke`` because its outcome depends on
+    the patch.
+
+    :param runner: Shared CLI test runner
+    :type runner: CliRunner
+    :return: Result of ``fib --index 100 --benchmark --dry-run``
+    :rtype: Result
+    """
+    with patch.object(
+        Estimator,
+        "run_micro_benchmark",
+        side_effect=lambda _func, inputs: [(n, 0.001) for n in inputs],
+    ) as mock_benchmark:
+        result = runner.invoke(
+            app, ["fib", "--index", "100", "--benchmark", "--dry-run"]
+        )
+    mock_benchmark.assert_called_once()
+    return result
+
+
+@pytest.fixture
+def max_digits_20000() -> Iterator[None]:
+    """Run a test with the int-to-str digit limit lowered to 20,000.
+
+    The original limit is restored at teardown.
+    """
+    original_limit = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(20000)
+    yield
+    sys.set_int_max_str_digits(original_limit)
+
+
+@pytest.fixture(scope="session")
+def read_output() -> Callable[[str], str]:
+    """Provide a memoized reader for result files written by the CLI.
+
+    :return: Function returning the UTF-8 content of a file path
+    :rtype: Callable[[str], str]
+    """
+    cache: Dict[str, str] = {}
+
+    def _read(filepath: str) -> str:
+        if filepath not in cache:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                cache[filepath] = f.read()
+        return cache[filepath]
+
+    return _read
+
+
+@pytest.fixture(scope="session")
+def calc() -> PrimeCalculator:
+    """Provide one PrimeCalculator shared by the prime tests.
+
+    :return: Prime calculator instance
+    :rtype: PrimeCalculator
+    """
+    return PrimeCalculator()
+
+
+@pytest.fixture
+def mock_rss() -> Iterator[Mock]:
+    """Patch the RSS reader to report usage well under the memory limit.
+
+    Tests reassign ``return_value`` to simulate other usage levels.
+
+    :return: Mock standing in for _rss_bytes
+    :rtype: Iterator[Mock]
+    """
+    with patch('src.core.resource_manager._rss_bytes') as mock_memory:
+        mock_memory.return_value = MAX_MEMORY_BYTES // 2
+        yield mock_memory
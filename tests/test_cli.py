@@ -129,6 +129,33 @@ class TestCLIArgumentParsing:
         )
         assert result.exit_code != 0
 
+    def test_cli_accepts_index_list_flag(self) -> None:
+        """Test --index-list calculates every index in one invocation."""
+        runner = CliRunner()
+        result = runner.invoke(app, ["fib", "--index-list", "10,20,30"])
+        assert result.exit_code == 0
+        assert result.stdout.count("Result (") == 3
+        assert "55" in result.stdout
+        assert "6765" in result.stdout
+        assert "832040" in result.stdout
+
+    def test_cli_index_list_rejects_invalid_entries(self) -> None:
+        """Test --index-list rejects non-integer and negative entries."""
+        runner = CliRunner()
+        result = runner.invoke(app, ["fib", "--index-list", "10,abc"])
+        assert result.exit_code != 0
+
+        result = runner.invoke(app, ["fib", "--index-list", "10,-1"])
+        assert result.exit_code != 0
+
+    def test_cli_index_list_is_mutually_exclusive(self) -> None:
+        """Test --index-list cannot be combined with --index."""
+        runner = CliRunner()
+        result = runner.invoke(
+            app, ["fib", "--index", "10", "--index-list", "10,20"]
+        )
+        assert result.exit_code != 0
+
 
 class TestCLIFlags:
     """Test CLI flag functionality."""
@@ -295,6 +322,16 @@ class TestCLIOutputFormatting:
             assert os.path.exists(results_dir)
             assert os.path.exists(filepath)
 
+    def test_write_result_does_not_overwrite_previous_result(self) -> None:
+        """Test results written in the same second get distinct files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = write_result_to_file(1, "fib", output_dir=tmpdir)
+            second = write_result_to_file(2, "fib", output_dir=tmpdir)
+
+            assert first != second
+            assert os.path.exists(first)
+            assert os.path.exists(second)
+
 
 class TestCLICalculatorIntegration:
     """Test CLI calculator integration."""
@@ -15,15 +15,17 @@ Dependencies:
 """
 
 import math
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
 from src.calculators.base import Calculator
 from src.calculators.factorial import (
+    PRIME_SWING_CUTOFF,
     FactorialCalculator,
     _binary_splitting_factorial,
     benchmark_factorial_methods,
+    prime_swing_factorial,
 )
 from src.config import MAX_MEMORY_BYTES
 from src.core.exceptions import InputError, ResourceExhaustedError
@@ -124,6 +126,37 @@ class TestFactorialBenchmarkComparison:
             assert binary_result == math_result
 
 
+class TestPrimeSwingFactorial:
+    """Test Prime Swing factorial implementation."""
+
+    def test_prime_swing_factorial_correctness_small(self) -> None:
+        """Test Prime Swing factorial for small values (table range)."""
+        for n in range(0, 40):
+            result = prime_swing_factorial(n)
+            expected = math.factorial(n)
+            msg = (
+                f"Prime Swing failed for {n}!: "
+                f"got {result}, expected {expected}"
+            )
+            assert result == expected, msg
+
+    def test_prime_swing_factorial_correctness_large(self) -> None:
+        """Test Prime Swing factorial for larger values."""
+        for n in [97, 100, 1000, 4321]:
+            assert prime_swing_factorial(n) == math.factorial(n)
+
+    def test_prime_swing_factorial_negative_raises_error(self) -> None:
+        """Test Prime Swing raises error for negative input."""
+        with pytest.raises(ValueError):
+            prime_swing_factorial(-1)
+
+    def test_calculate_by_index_above_cutoff(self) -> None:
+        """Test calculate_by_index is exact above the Prime Swing cutoff."""
+        calc = FactorialCalculator()
+        n = PRIME_SWING_CUTOFF + 1
+        assert calc.calculate_by_index(n) == math.factorial(n)
+
+
 class TestFactorialCalculatorBasic:
     """Test basic Factorial calculation functionality."""
 
@@ -262,8 +295,8 @@ class TestFactorialCalculatorResourceManager:
         """Test calculate_by_index is wrapped with memory monitoring."""
         calc = FactorialCalculator()
 
-        with patch('psutil.Process.memory_info') as mock_memory:
-            mock_memory.return_value = Mock(rss=MAX_MEMORY_BYTES // 2)
+        with patch('src.core.resource_manager._rss_bytes') as mock_memory:
+            mock_memory.return_value = MAX_MEMORY_BYTES // 2
             result = calc.calculate_by_index(10)
             assert result == 3628800
 
@@ -273,8 +306,8 @@ class TestFactorialCalculatorResourceManager:
         """Test ResourceExhaustedError when memory exceeded."""
         calc = FactorialCalculator()
 
-        with patch('psutil.Process.memory_info') as mock_memory:
-            mock_memory.return_value = Mock(rss=MAX_MEMORY_BYTES + 1)
+        with patch('src.core.resource_manager._rss_bytes') as mock_memory:
+            mock_memory.return_value = MAX_MEMORY_BYTES + 1
             with pytest.raises(ResourceExhaustedError):
                 calc.calculate_by_index(10)
 
@@ -282,8 +315,8 @@ class TestFactorialCalculatorResourceManager:
         """Test calculate_by_digits is wrapped with memory monitoring."""
         calc = FactorialCalculator()
 
-        with patch('psutil.Process.memory_info') as mock_memory:
-            mock_memory.return_value = Mock(rss=MAX_MEMORY_BYTES // 2)
+        with patch('src.core.resource_manager._rss_bytes') as mock_memory:
+            mock_memory.return_value = MAX_MEMORY_BYTES // 2
             result = calc.calculate_by_digits(2)
             assert result == 24
 
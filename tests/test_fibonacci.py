@@ -13,7 +13,7 @@ Dependencies:
     - src.config: Configuration constants
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -234,8 +234,8 @@ class TestFibonacciCalculatorResourceManager:
         """Test that calculate_by_index is wrapped with memory monitoring."""
         calc = FibonacciCalculator()
 
-        with patch('psutil.Process.memory_info') as mock_memory:
-            mock_memory.return_value = Mock(rss=MAX_MEMORY_BYTES // 2)
+        with patch('src.core.resource_manager._rss_bytes') as mock_memory:
+            mock_memory.return_value = MAX_MEMORY_BYTES // 2
             result = calc.calculate_by_index(10)
             assert result == 55
 
@@ -245,8 +245,8 @@ class TestFibonacciCalculatorResourceManager:
         """Test ResourceExhaustedError when memory exceeded."""
         calc = FibonacciCalculator()
 
-        with patch('psutil.Process.memory_info') as mock_memory:
-            mock_memory.return_value = Mock(rss=MAX_MEMORY_BYTES + 1)
+        with patch('src.core.resource_manager._rss_bytes') as mock_memory:
+            mock_memory.return_value = MAX_MEMORY_BYTES + 1
             with pytest.raises(ResourceExhaustedError):
                 calc.calculate_by_index(10)
 
@@ -254,8 +254,8 @@ class TestFibonacciCalculatorResourceManager:
         """Test that calculate_by_digits is wrapped with memory monitoring."""
         calc = FibonacciCalculator()
 
-        with patch('psutil.Process.memory_info') as mock_memory:
-            mock_memory.return_value = Mock(rss=MAX_MEMORY_BYTES // 2)
+        with patch('src.core.resource_manager._rss_bytes') as mock_memory:
+            mock_memory.return_value = MAX_MEMORY_BYTES // 2
             result = calc.calculate_by_digits(2)
             assert result == 13
 
@@ -6,37 +6,63 @@ accuracy, and dry-run functionality.
 
 Dependencies:
     - pytest: Testing framework
+    - re: Output parsing
     - sys: System-specific parameters
+    - contextlib: Context manager helpers
+    - unittest.mock: Mocking utilities
     - typer.testing: CLI testing utilities
+    - src.calculators.fibonacci: FibonacciCalculator class
     - src.cli: CLI application
+    - tests.conftest: CliInvoke fixture type
 """
 
+import re
 import sys
+from contextlib import contextmanager
+from typing import Iterator
+from unittest.mock import patch
 
-from typer.testing import CliRunner
+import pytest
+from typer.testing import CliRunner, Result
 
-from src.cli import app
+from src.calculators.fibonacci import FibonacciCalculator
+from src.cli import app, configure_int_max_str_digits
+from tests.conftest import CliInvoke
+
+_RAM_RE = re.compile(r"Peak RAM usage:\s*([0-9.]+)\s*MB")
+_EST_RE = re.compile(
+    r"Estimated execution time:\s*([0-9.eE+-]+)\s*seconds"
+)
+
+
+@contextmanager
+def _int_max_str_digits(limit: int) -> Iterator[None]:
+    """Temporarily set the int-to-str digit limit, restoring it on exit.
+
+    :param limit: Digit limit to apply inside the block
+    :type limit: int
+    """
+    original_limit = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(limit)
+    try:
+        yield
+    finally:
+        sys.set_int_max_str_digits(original_limit)
 
 
 class TestRAMUsageTracking:  # pylint: disable=too-few-public-methods
     """Test that RAM usage is tracked correctly (no negative values)."""
 
-    def test_ram_usage_is_non_negative(self) -> None:
+    def test_ram_usage_is_non_negative(self, invoke: CliInvoke) -> None:
         """Test that reported RAM usage is never negative."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["fib", "--index", "10"])
+        result = invoke(["fib", "--index", "10"])
 
         assert result.exit_code == 0
-        assert "Peak RAM usage:" in result.stdout
 
-        lines = result.stdout.split('\n')
-        ram_line = [line for line in lines if 'Peak RAM usage' in line]
-        assert len(ram_line) > 0
+        match = _RAM_RE.search(result.stdout)
+        assert match is not None, "Peak RAM usage not reported"
 
-        ram_value_str = (
-            ram_line[0].split(':')[1].strip().replace(' MB', '')
-        )
-        ram_value = float(ram_value_str)
+        ram_value = float(match.group(1))
         msg = f"RAM usage should be non-negative, got {ram_value}"
         assert ram_value >= 0, msg
 
@@ -44,65 +70,60 @@ class TestRAMUsageTracking:  # pylint: disable=too-few-public-methods
 class TestLargeNumberStringConversion:
     """Test large numbers (10,000+ digits) can be converted to strings."""
 
-    def test_large_fibonacci_string_conversion(self) -> None:
+    @pytest.mark.usefixtures("max_digits_20000")
+    def test_large_fibonacci_string_conversion(
+        self, runner: CliRunner
+    ) -> None:
         """Test Fibonacci numbers with 10,000+ digits can be converted."""
-        original_limit = sys.get_int_max_str_digits()
-        try:
-            sys.set_int_max_str_digits(20000)
-
-            runner = CliRunner()
-            result = runner.invoke(app, ["fib", "--index", "1000000"])
-
-            assert "Exceeds the limit" not in result.stdout
-            assert "sys.set_int_max_str_digits" not in result.stdout
+        large_result = 10 ** 15000
+        with patch.object(
+            FibonacciCalculator,
+            "calculate_by_index",
+            return_value=large_result,
+        ):
+            # Not memoized: the outcome depends on the patch and limit
+            result = runner.invoke(app, ["fib", "--index", "100"])
 
-            if result.exit_code != 0:
-                assert "string conversion" not in result.stdout.lower()
-        finally:
-            sys.set_int_max_str_digits(original_limit)
+        assert result.exit_code == 0
+        assert "Exceeds the limit" not in result.stdout
+        assert "sys.set_int_max_str_digits" not in result.stdout
+        assert "Result (15001 digits" in result.stdout
 
     def test_cli_sets_int_max_str_digits(self) -> None:
         """Test CLI automatically sets int_max_str_digits for large numbers."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["fib", "--index", "100000"])
+        with _int_max_str_digits(4300):
+            configure_int_max_str_digits()
+            assert sys.get_int_max_str_digits() >= 20000
+
+    def test_cli_converts_large_result_end_to_end(
+        self, invoke: CliInvoke
+    ) -> None:
+        """Test a 20,000+ digit result is printed without limit errors."""
+        result = invoke(["fib", "--index", "100000"])
 
+        assert result.exit_code == 0
         assert "Exceeds the limit" not in result.stdout
-        assert "sys.set_int_max_str_digits" not in result.stdout
+        assert "Result (20899 digits" in result.stdout
 
 
 class TestEstimatorAccuracy:
     """Test that estimator provides accurate time predictions."""
 
-    def test_estimator_provides_non_zero_estimate(self) -> None:
+    def test_estimator_provides_non_zero_estimate(
+        self, benchmark_dryrun_result: Result
+    ) -> None:
         """Test estimator provides non-zero estimate for reasonable inputs."""
-        runner = CliRunner()
-        result = runner.invoke(
-            app, ["prime", "--index", "1000", "--benchmark", "--dry-run"]
-        )
+        assert benchmark_dryrun_result.exit_code == 0
 
-        assert result.exit_code == 0
-        assert "Estimated execution time:" in result.stdout
-
-        lines = result.stdout.split('\n')
-        time_line = [
-            line
-            for line in lines
-            if 'Estimated execution time' in line
-        ]
-        assert len(time_line) > 0
-
-        time_str = (
-            time_line[0].split(':')[1].strip().replace(' seconds', '')
-        )
-        estimated_time = float(time_str)
+        match = _EST_RE.search(benchmark_dryrun_result.stdout)
+        assert match is not None, "Estimated execution time not reported"
+
+        estimated_time = float(match.group(1))
         assert isinstance(estimated_time, float)
 
-    def test_estimator_estimate_vs_actual(self) -> None:
+    def test_estimator_estimate_vs_actual(self, invoke: CliInvoke) -> None:
         """Test estimator provides reasonable estimate vs actual time."""
-        runner = CliRunner()
-        result = runner.invoke(
-            app, ["prime", "--index", "100", "--benchmark"]
-        )
+        result = invoke(["prime", "--index", "100", "--benchmark"])
 
         assert result.exit_code == 0
         assert (
@@ -114,29 +135,19 @@ class TestEstimatorAccuracy:
 class TestDryRunBenchmark:
     """Test that dry-run properly runs benchmarks."""
 
-    def test_dry_run_runs_benchmark(self) -> None:
+    def test_dry_run_runs_benchmark(
+        self, benchmark_dryrun_result: Result
+    ) -> None:
         """Test dry-run actually runs benchmark and shows estimate."""
-        runner = CliRunner()
-        result = runner.invoke(
-            app, ["prime", "--index", "10000", "--dry-run"]
-        )
+        assert benchmark_dryrun_result.exit_code == 0
+        assert "micro-benchmark" in benchmark_dryrun_result.stdout
+        assert "seconds" in benchmark_dryrun_result.stdout
 
-        assert result.exit_code == 0
-        assert "Dry run" in result.stdout
-        assert (
-            "micro-benchmark" in result.stdout
-            or "Estimated execution time" in result.stdout
-        )
-        assert "seconds" in result.stdout
-
-    def test_dry_run_does_not_perform_calculation(self) -> None:
+    def test_dry_run_does_not_perform_calculation(
+        self, benchmark_dryrun_result: Result
+    ) -> None:
         """Test dry-run does not perform the actual calculation."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["fib", "--index", "100", "--dry-run"])
-
-        assert result.exit_code == 0
-        assert "Dry run" in result.stdout
-        assert (
-            "354224848179261915075" not in result.stdout
-            or "Dry run" in result.stdout
-        )
+        assert benchmark_dryrun_result.exit_code == 0
+        assert "Dry run" in benchmark_dryrun_result.stdout
+        assert "354224848179261915075" not in benchmark_dryrun_result.stdout
+        assert "Full result saved to" not in benchmark_dryrun_result.stdout
@@ -6,182 +6,114 @@ workflows from CLI input through calculator execution to output generation.
 Dependencies:
     - pytest: Testing framework
     - os: File system operations
+    - re: Output parsing
     - typer.testing: CLI testing utilities
-    - src.cli: CLI application
+    - tests.conftest: CliInvoke fixture type
 """
 
 import os
-
-from typer.testing import CliRunner
-
-from src.cli import app
-
-
-class TestEndToEndWorkflows:
-    """Test complete end-to-end workflows: CLI → Calculator → Output."""
-
-    def test_fibonacci_by_index_workflow(self) -> None:
-        """Test complete workflow for Fibonacci calculation by index."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["fib", "--index", "10"])
-
-        assert result.exit_code == 0
-        assert "55" in result.stdout
-        assert "Result" in result.stdout
-        assert "Metadata" in result.stdout
-        assert "Full result saved to" in result.stdout
-
-    def test_fibonacci_by_digits_workflow(self) -> None:
-        """Test complete workflow for Fibonacci calculation by digits."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["fib", "--min-digits", "2"])
-
-        assert result.exit_code == 0
-        assert "Result" in result.stdout
-        assert "digits" in result.stdout
-        assert "11" in result.stdout or "13" in result.stdout
-
-    def test_factorial_by_index_workflow(self) -> None:
-        """Test complete workflow for Factorial calculation by index."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["fact", "--index", "5"])
-
-        assert result.exit_code == 0
-        assert "120" in result.stdout
-        assert "Result" in result.stdout
-        assert "Metadata" in result.stdout
-
-    def test_factorial_by_digits_workflow(self) -> None:
-        """Test complete workflow for Factorial calculation by digits."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["fact", "--min-digits", "3"])
-
-        assert result.exit_code == 0
-        assert "Result" in result.stdout
-        assert "digits" in result.stdout
-
-    def test_prime_by_index_workflow(self) -> None:
-        """Test complete workflow for Prime calculation by index."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["prime", "--index", "10"])
-
-        assert result.exit_code == 0
-        assert "29" in result.stdout
-        assert "Result" in result.stdout
-        assert "Metadata" in result.stdout
-
-    def test_prime_by_digits_workflow(self) -> None:
-        """Test complete workflow for Prime calculation by digits."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["prime", "--min-digits", "3"])
-
-        assert result.exit_code == 0
-        assert "101" in result.stdout
-        assert "Result" in result.stdout
-        assert "Metadata" in result.stdout
-
-    def test_workflow_with_benchmark_flag(self) -> None:
-        """Test complete workflow with --benchmark flag."""
-        runner = CliRunner()
-        result = runner.invoke(
-            app, ["fib", "--index", "100", "--benchmark"]
-        )
-
-        assert result.exit_code == 0
-        assert (
-            "Estimated execution time" in result.stdout
-            or "micro-benchmark" in result.stdout
-        )
-        assert "Result" in result.stdout
-
-    def test_workflow_with_dry_run_flag(self) -> None:
-        """Test complete workflow with --dry-run flag."""
-        runner = CliRunner()
-        result = runner.invoke(
-            app, ["fib", "--index", "1000", "--dry-run"]
-        )
-
-        assert result.exit_code == 0
-        assert (
-            "Estimated execution time" in result.stdout
-            or "micro-benchmark" in result.stdout
-        )
-        assert "Dry run" in result.stdout
-
-    def test_workflow_with_strict_flag(self) -> None:
-        """Test complete workflow with --strict flag."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["fib", "--index", "10", "--strict"])
-
-        assert result.exit_code == 0
-        assert "Result" in result.stdout
-
-    def test_workflow_file_output(self) -> None:
-        """Test that workflow creates output file."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["fib", "--index", "10"])
-
-        assert result.exit_code == 0
-        assert "Full result saved to" in result.stdout
-
-        filepath_lines = [
-            line
-            for line in result.stdout.split('\n')
-            if 'Full result saved to' in line
-        ]
-        if filepath_lines:
-            filepath = filepath_lines[0].split(': ')[-1].strip()
-            assert os.path.exists(filepath)
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-                assert "55" in content or "Result" in content
-
-    def test_workflow_error_handling(self) -> None:
-        """Test that workflow handles errors gracefully."""
-        runner = CliRunner()
-
-        result = runner.invoke(app, ["fib", "--index", "-1"])
-        assert result.exit_code != 0
-        error_output = result.stdout + result.stderr
-        assert "Error" in error_output or "error" in error_output.lower()
-
-        result = runner.invoke(app, ["fib"])
-        assert result.exit_code != 0
-
-    def test_workflow_with_all_flags(self) -> None:
-        """Test complete workflow with all flags enabled."""
-        runner = CliRunner()
-        result = runner.invoke(
-            app,
-            [
-                "fib",
-                "--index",
-                "50",
-                "--benchmark",
-                "--strict",
-            ],
-        )
-
-        assert result.exit_code == 0
-        assert "Result" in result.stdout
-
-    def test_workflow_large_calculation(self) -> None:
-        """Test workflow with larger calculation."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["fib", "--index", "100"])
-
-        assert result.exit_code == 0
-        assert "Result" in result.stdout
-        assert "Metadata" in result.stdout
-
-    def test_workflow_output_formatting(self) -> None:
-        """Test that workflow formats output correctly."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["fib", "--index", "10"])
-
-        assert result.exit_code == 0
-        assert "Result" in result.stdout
-        assert "digits" in result.stdout
-        assert "Metadata" in result.stdout
-        assert "Execution time" in result.stdout
-        assert "RAM usage" in result.stdout or "Peak RAM" in result.stdout
+import re
+from typing import Callable, List
+
+import pytest
+from typer.testing import Result
+
+from tests.conftest import CliInvoke
+
+_PATH_RE = re.compile(r"Full result saved to:\s*(.+)$", re.M)
+
+
+@pytest.mark.parametrize(
+    ("argv", "expected"),
+    [
+        (["fib", "--index", "10"], "55"),
+        (["fib", "--min-digits", "2"], "13"),
+        (["fact", "--index", "5"], "120"),
+        (["fact", "--min-digits", "3"], "120"),
+        (["prime", "--index", "10"], "29"),
+        (["prime", "--min-digits", "3"], "101"),
+    ],
+    ids=[
+        "fib-by-index",
+        "fib-by-digits",
+        "fact-by-index",
+        "fact-by-digits",
+        "prime-by-index",
+        "prime-by-digits",
+    ],
+)
+def test_calculation_workflow(
+    invoke: CliInvoke, argv: List[str], expected: str
+) -> None:
+    """Test complete workflow for each calculator and mode."""
+    result = invoke(argv)
+
+    assert result.exit_code == 0
+    assert expected in result.stdout
+    assert "Result" in result.stdout
+    assert "digits" in result.stdout
+    assert "Metadata" in result.stdout
+    assert "Full result saved to" in result.stdout
+
+
+def test_workflow_with_dry_run_flag(benchmark_dryrun_result: Result) -> None:
+    """Test complete workflow with --dry-run flag."""
+    assert benchmark_dryrun_result.exit_code == 0
+    assert "Dry run" in benchmark_dryrun_result.stdout
+
+
+def test_workflow_file_output(
+    invoke: CliInvoke, read_output: Callable[[str], str]
+) -> None:
+    """Test that workflow creates output file."""
+    result = invoke(["fib", "--index", "10"])
+
+    assert result.exit_code == 0
+
+    match = _PATH_RE.search(result.stdout)
+    assert match is not None, "Result file path not reported"
+
+    filepath = match.group(1).strip()
+    assert os.path.exists(filepath)
+    content = read_output(filepath)
+    assert "55" in content or "Result" in content
+
+
+def test_workflow_error_handling(invoke: CliInvoke) -> None:
+    """Test that workflow handles errors gracefully."""
+    result = invoke(["fib", "--index", "-1"])
+    assert result.exit_code != 0
+    error_output = result.stdout + result.stderr
+    assert "Error" in error_output or "error" in error_output.lower()
+
+    result = invoke(["fib"])
+    assert result.exit_code != 0
+
+
+def test_workflow_with_all_flags(invoke: CliInvoke) -> None:
+    """Test --benchmark --strict estimates, then runs a 21-digit calculation.
+
+    Covers what the separate benchmark-flag, strict-flag and
+    large-calculation tests checked, on the shared canonical invocation.
+    """
+    result = invoke(["fib", "--index", "100", "--benchmark", "--strict"])
+
+    assert result.exit_code == 0
+    assert (
+        "Estimated execution time" in result.stdout
+        or "micro-benchmark" in result.stdout
+    )
+    assert "354224848179261915075" in result.stdout
+    assert "Result (21 digits" in result.stdout
+    assert "Metadata" in result.stdout
+
+
+def test_workflow_output_formatting(invoke: CliInvoke) -> None:
+    """Test that workflow formats output correctly."""
+    result = invoke(["fib", "--index", "10"])
+
+    assert result.exit_code == 0
+    required = ("Result", "digits", "Metadata", "Execution time")
+    missing = [s for s in required if s not in result.stdout]
+    assert not missing, missing
+    assert "RAM usage" in result.stdout or "Peak RAM" in result.stdout
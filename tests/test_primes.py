@@ -6,7 +6,9 @@ primality tests, digit-based calculations, and resource management
 integration.
 
 Dependencies:
+    - itertools: Interrupting the sieve's compress step
     - pytest: Testing framework
+    - typing: Type hints
     - unittest.mock: Mocking utilities
     - src.calculators.primes: PrimeCalculator class
     - src.calculators.base: Calculator base class
@@ -14,10 +16,18 @@ Dependencies:
     - src.core.resource_manager: Monitoring decorators
 """
 
+from itertools import compress, islice
+from typing import Iterator
+
 import pytest
 
 from src.calculators.base import Calculator
-from src.calculators.primes import PrimeCalculator
+from src.calculators.primes import (
+    SEGMENTED_SIEVE_THRESHOLD,
+    SIEVE_SEGMENT_BYTES,
+    WHEEL_MODULUS,
+    PrimeCalculator,
+)
 from src.core.exceptions import InputError
 
 
@@ -37,39 +47,52 @@ class TestPrimeCalculatorSegmentedSieve:
         calc = PrimeCalculator()
         assert calc is not None
 
-    def test_calculate_by_index_first_prime(self) -> None:
+    @pytest.mark.parametrize(
+        "method", ["miller_rabin", "baillie_psw", "calculate_by_digits"]
+    )
+    def test_public_method_exists(
+        self, calc: PrimeCalculator, method: str
+    ) -> None:
+        """Test that each public method exists and is callable."""
+        assert callable(getattr(calc, method, None))
+
+    def test_calculate_by_index_first_prime(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test that 1st prime = 2 (OEIS A000040)."""
-        calc = PrimeCalculator()
         result = calc.calculate_by_index(1)
         assert result == 2
 
-    def test_calculate_by_index_second_prime(self) -> None:
+    def test_calculate_by_index_second_prime(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test that 2nd prime = 3 (OEIS A000040)."""
-        calc = PrimeCalculator()
         result = calc.calculate_by_index(2)
         assert result == 3
 
-    def test_calculate_by_index_third_prime(self) -> None:
+    def test_calculate_by_index_third_prime(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test that 3rd prime = 5 (OEIS A000040)."""
-        calc = PrimeCalculator()
         result = calc.calculate_by_index(3)
         assert result == 5
 
-    def test_calculate_by_index_tenth_prime(self) -> None:
+    def test_calculate_by_index_tenth_prime(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test that 10th prime = 29 (OEIS A000040)."""
-        calc = PrimeCalculator()
         result = calc.calculate_by_index(10)
         assert result == 29
 
-    def test_calculate_by_index_hundredth_prime(self) -> None:
+    def test_calculate_by_index_hundredth_prime(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test that 100th prime = 541 (OEIS A000040)."""
-        calc = PrimeCalculator()
         result = calc.calculate_by_index(100)
         assert result == 541
 
-    def test_calculate_by_index_sequence(self) -> None:
+    def test_calculate_by_index_sequence(self, calc: PrimeCalculator) -> None:
         """Test prime sequence for first 10 primes."""
-        calc = PrimeCalculator()
         expected = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
         for i, expected_prime in enumerate(expected, start=1):
             result = calc.calculate_by_index(i)
@@ -79,37 +102,83 @@ class TestPrimeCalculatorSegmentedSieve:
             )
             assert result == expected_prime, msg
 
-    def test_calculate_by_index_larger_value(self) -> None:
+    def test_calculate_by_index_larger_value(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test calculation for larger index (1000th prime = 7919)."""
-        calc = PrimeCalculator()
         result = calc.calculate_by_index(1000)
         assert result == 7919
 
-    def test_calculate_by_index_zero_raises_error(self) -> None:
+    @pytest.mark.parametrize(
+        "n, expected",
+        [(10000, 104729), (100000, 1299709), (200000, 2750159)],
+    )
+    def test_calculate_by_index_segmented_range(
+        self, calc: PrimeCalculator, n: int, expected: int
+    ) -> None:
+        """Test indices whose bound exceeds SEGMENTED_SIEVE_THRESHOLD."""
+        assert calc.calculate_by_index(n) == expected
+
+    @pytest.mark.parametrize(
+        "limit",
+        [
+            SEGMENTED_SIEVE_THRESHOLD - 1,
+            SEGMENTED_SIEVE_THRESHOLD,
+            123457,
+            WHEEL_MODULUS * SIEVE_SEGMENT_BYTES - 1,
+            WHEEL_MODULUS * SIEVE_SEGMENT_BYTES,
+            10 ** 6,
+        ],
+    )
+    def test_segmented_sieve_matches_simple_sieve(
+        self, calc: PrimeCalculator, limit: int
+    ) -> None:
+        """Test the wheel sieve across threshold and segment edges."""
+        segmented = calc._segmented_sieve(limit)  # pylint: disable=protected-access
+        assert segmented == calc._simple_sieve(limit)  # pylint: disable=protected-access
+
+    def test_calculate_by_index_zero_raises_error(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test that index 0 raises InputError (no 0th prime)."""
-        calc = PrimeCalculator()
         with pytest.raises(InputError):
             calc.calculate_by_index(0)
 
-    def test_calculate_by_index_negative_raises_error(self) -> None:
+    def test_calculate_by_index_negative_raises_error(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test that negative index raises InputError."""
-        calc = PrimeCalculator()
         with pytest.raises(InputError):
             calc.calculate_by_index(-1)
 
+    def test_known_primes_cache_survives_interrupted_extension(
+        self, calc: PrimeCalculator, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test an exception while extending leaves the cache consistent."""
+        seed = ([2, 3, 5, 7], 10)
+        monkeypatch.setattr(PrimeCalculator, "_known_primes", seed)
+
+        def interrupted(data: range, selectors: bytearray) -> Iterator[int]:
+            yield from islice(compress(data, selectors), 1)
+            raise RuntimeError("interrupted mid-extension")
+
+        with monkeypatch.context() as patched:
+            patched.setattr("src.calculators.primes.compress", interrupted)
+            with pytest.raises(RuntimeError):
+                calc._sieving_primes(5000)  # pylint: disable=protected-access
+        assert PrimeCalculator._known_primes == seed  # pylint: disable=protected-access
+
+        expected = calc._simple_sieve(5000)  # pylint: disable=protected-access
+        assert calc._sieving_primes(5000) == expected  # pylint: disable=protected-access
+
 
 class TestMillerRabinPrimalityTest:
     """Test Miller-Rabin primality test functionality."""
 
-    def test_miller_rabin_method_exists(self) -> None:
-        """Test that miller_rabin method exists."""
-        calc = PrimeCalculator()
-        assert hasattr(calc, 'miller_rabin')
-        assert callable(calc.miller_rabin)
-
-    def test_miller_rabin_identifies_small_primes(self) -> None:
+    def test_miller_rabin_identifies_small_primes(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test Miller-Rabin correctly identifies small primes."""
-        calc = PrimeCalculator()
         small_primes = [
             2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47,
         ]
@@ -117,9 +186,10 @@ class TestMillerRabinPrimalityTest:
             msg = f"{prime} should be identified as prime"
             assert calc.miller_rabin(prime), msg
 
-    def test_miller_rabin_identifies_composites(self) -> None:
+    def test_miller_rabin_identifies_composites(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test Miller-Rabin correctly identifies composite numbers."""
-        calc = PrimeCalculator()
         composites = [
             4, 6, 8, 9, 10, 12, 14, 15, 16, 18, 20, 21, 22, 24, 25,
         ]
@@ -127,40 +197,55 @@ class TestMillerRabinPrimalityTest:
             msg = f"{composite} should be identified as composite"
             assert not calc.miller_rabin(composite), msg
 
-    def test_miller_rabin_handles_edge_cases(self) -> None:
+    def test_miller_rabin_handles_edge_cases(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test Miller-Rabin with edge cases."""
-        calc = PrimeCalculator()
         assert not calc.miller_rabin(1)
         assert calc.miller_rabin(2)
         assert not calc.miller_rabin(4)
         assert not calc.miller_rabin(100)
 
-    def test_miller_rabin_large_prime(self) -> None:
+    def test_miller_rabin_large_prime(self, calc: PrimeCalculator) -> None:
         """Test Miller-Rabin with a known large prime."""
-        calc = PrimeCalculator()
         assert calc.miller_rabin(7919)
 
-    def test_miller_rabin_large_composite(self) -> None:
+    def test_miller_rabin_large_composite(self, calc: PrimeCalculator) -> None:
         """Test Miller-Rabin with a known large composite."""
-        calc = PrimeCalculator()
         assert not calc.miller_rabin(15838)
 
-    def test_miller_rabin_deterministic_range(self) -> None:
+    def test_miller_rabin_deterministic_range(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test Miller-Rabin is deterministic for n < 3×10²⁴."""
-        calc = PrimeCalculator()
         test_primes = [97, 101, 103, 107, 109, 113]
         for prime in test_primes:
             msg = f"{prime} should be deterministically prime"
             assert calc.miller_rabin(prime), msg
 
-    def test_miller_rabin_carmichael_numbers(self) -> None:
+    def test_miller_rabin_carmichael_numbers(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test Miller-Rabin with Carmichael numbers."""
-        calc = PrimeCalculator()
         assert not calc.miller_rabin(561)
 
-    def test_miller_rabin_very_large_number(self) -> None:
+    def test_miller_rabin_single_base_range(
+        self, calc: PrimeCalculator
+    ) -> None:
+        """Test the single-base range agrees with the sieve."""
+        limit = 20000
+        primes = set(calc._simple_sieve(limit))  # pylint: disable=protected-access
+        for n in range(limit):
+            assert calc.miller_rabin(n) == (n in primes), n
+
+        base_2_pseudoprimes = [2047, 3277, 4033, 4681, 8321, 15841]
+        for composite in base_2_pseudoprimes:
+            assert not calc.miller_rabin(composite), composite
+
+    def test_miller_rabin_very_large_number(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test Miller-Rabin with very large number (probabilistic)."""
-        calc = PrimeCalculator()
         result = calc.miller_rabin(982451653)
         assert result is True or result is False
         assert result
@@ -169,15 +254,10 @@ class TestMillerRabinPrimalityTest:
 class TestBailliePSWTest:
     """Test Baillie-PSW primality test functionality."""
 
-    def test_baillie_psw_method_exists(self) -> None:
-        """Test that baillie_psw method exists."""
-        calc = PrimeCalculator()
-        assert hasattr(calc, 'baillie_psw')
-        assert callable(calc.baillie_psw)
-
-    def test_baillie_psw_identifies_small_primes(self) -> None:
+    def test_baillie_psw_identifies_small_primes(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test Baillie-PSW correctly identifies small primes."""
-        calc = PrimeCalculator()
         small_primes = [
             2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47,
         ]
@@ -185,9 +265,10 @@ class TestBailliePSWTest:
             msg = f"{prime} should be identified as prime"
             assert calc.baillie_psw(prime), msg
 
-    def test_baillie_psw_identifies_composites(self) -> None:
+    def test_baillie_psw_identifies_composites(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test Baillie-PSW correctly identifies composite numbers."""
-        calc = PrimeCalculator()
         composites = [
             4, 6, 8, 9, 10, 12, 14, 15, 16, 18, 20, 21, 22, 24, 25,
         ]
@@ -195,59 +276,76 @@ class TestBailliePSWTest:
             msg = f"{composite} should be identified as composite"
             assert not calc.baillie_psw(composite), msg
 
-    def test_baillie_psw_handles_edge_cases(self) -> None:
+    def test_baillie_psw_handles_edge_cases(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test Baillie-PSW with edge cases."""
-        calc = PrimeCalculator()
         assert not calc.baillie_psw(1)
         assert calc.baillie_psw(2)
         assert not calc.baillie_psw(4)
         assert not calc.baillie_psw(100)
 
-    def test_baillie_psw_large_prime(self) -> None:
+    def test_baillie_psw_large_prime(self, calc: PrimeCalculator) -> None:
         """Test Baillie-PSW with a known large prime."""
-        calc = PrimeCalculator()
         assert calc.baillie_psw(7919)
 
-    def test_baillie_psw_large_composite(self) -> None:
+    def test_baillie_psw_large_composite(self, calc: PrimeCalculator) -> None:
         """Test Baillie-PSW with a known large composite."""
-        calc = PrimeCalculator()
         assert not calc.baillie_psw(15838)
 
-    def test_baillie_psw_carmichael_numbers(self) -> None:
+    def test_baillie_psw_carmichael_numbers(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test Baillie-PSW with Carmichael numbers."""
-        calc = PrimeCalculator()
         assert not calc.baillie_psw(561)
 
-    def test_baillie_psw_very_large_prime(self) -> None:
+    def test_baillie_psw_rejects_small_factor_composites(
+        self, calc: PrimeCalculator
+    ) -> None:
+        """Test composites above the lookup set with small prime factors."""
+        for composite in [1001, 229 * 229, 3 * 982451653]:
+            msg = f"{composite} should be identified as composite"
+            assert not calc.baillie_psw(composite), msg
+            assert not calc.miller_rabin(composite), msg
+
+    def test_baillie_psw_rejects_strong_base_2_pseudoprimes(
+        self, calc: PrimeCalculator
+    ) -> None:
+        """Test the Lucas step rejects strong pseudoprimes to base 2."""
+        for composite in [3215031751, 3825123056546413051]:
+            msg = f"{composite} should be identified as composite"
+            assert not calc.baillie_psw(composite), msg
+
+    def test_baillie_psw_very_large_prime(self, calc: PrimeCalculator) -> None:
         """Test Baillie-PSW with very large prime."""
-        calc = PrimeCalculator()
         assert calc.baillie_psw(982451653)
 
     def test_baillie_psw_stronger_than_miller_rabin_alone(
-        self,
+        self, calc: PrimeCalculator
     ) -> None:
         """Test Baillie-PSW provides additional robustness."""
-        calc = PrimeCalculator()
         test_primes = [97, 101, 103, 107, 109, 113, 127, 131]
         for prime in test_primes:
             msg = f"{prime} should pass Baillie-PSW"
             assert calc.baillie_psw(prime), msg
 
-    def test_baillie_psw_performs_lucas_test(self) -> None:
+    def test_baillie_psw_performs_lucas_test(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test Baillie-PSW performs Lucas test, not just Miller-Rabin."""
-        calc = PrimeCalculator()
 
         assert hasattr(calc, '_lucas_sequence_iterative')
         assert hasattr(calc, '_jacobi_symbol')
-        assert hasattr(calc, '_lucas_double')
-        assert hasattr(calc, '_lucas_next')
+        assert hasattr(calc, '_lucas_chain')
+        assert hasattr(calc, '_lucas_double_with_q')
 
         result = calc.baillie_psw(97)
         assert result is True
 
-    def test_baillie_psw_lucas_sequence_computation(self) -> None:
+    def test_baillie_psw_lucas_sequence_computation(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test Lucas sequence computation works correctly."""
-        calc = PrimeCalculator()
 
         # Testing internal implementation details for correctness
         u, v = calc._lucas_sequence_iterative(1, -1, 5, 100)  # pylint: disable=protected-access
@@ -257,61 +355,111 @@ class TestBailliePSWTest:
         jacobi = calc._jacobi_symbol(5, 11)  # pylint: disable=protected-access
         assert jacobi in [-1, 0, 1]
 
+    def test_lucas_chain_montgomery_matches_plain_chain(
+        self, calc: PrimeCalculator
+    ) -> None:
+        """Test the Montgomery Lucas ladder agrees with the plain one."""
+        n = 2 ** 127 - 1
+        for p, q, k in [(1, -1, 5), (1, 2, 12345), (1, -3, n + 1)]:
+            # Testing internal implementation details for correctness
+            plain = calc._lucas_chain(p, q, k, n)  # pylint: disable=protected-access
+            montgomery = calc._lucas_chain_montgomery(p, q, k, n)  # pylint: disable=protected-access
+            assert montgomery == plain
+
+    def test_lucas_chain_dispatches_to_montgomery_above_threshold(
+        self, calc: PrimeCalculator, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test _lucas_chain switches ladders at MONTGOMERY_MIN_BITS."""
+        n = 2 ** 521 - 1
+        cases = [(1, -1, (n + 1) >> 1), (1, 2, n + 1), (3, -7, 12345)]
+        monkeypatch.setattr(
+            "src.calculators.primes.MONTGOMERY_MIN_BITS", n.bit_length() + 1
+        )
+        # Testing internal implementation details for correctness
+        plain = [calc._lucas_chain(p, q, k, n) for p, q, k in cases]  # pylint: disable=protected-access
+
+        montgomery_calls: list[int] = []
+        original = PrimeCalculator._lucas_chain_montgomery  # pylint: disable=protected-access
+
+        def counted(
+            self: PrimeCalculator, p: int, q: int, k: int, modulus: int
+        ) -> tuple[int, int, int]:
+            montgomery_calls.append(modulus)
+            return original(self, p, q, k, modulus)
+
+        monkeypatch.setattr(
+            PrimeCalculator, "_lucas_chain_montgomery", counted
+        )
+        monkeypatch.setattr(
+            "src.calculators.primes.MONTGOMERY_MIN_BITS", n.bit_length()
+        )
+        dispatched = [calc._lucas_chain(p, q, k, n) for p, q, k in cases]  # pylint: disable=protected-access
+        assert montgomery_calls == [n] * len(cases)
+        assert dispatched == plain
+
 
 class TestPrimeCalculatorByDigits:
     """Test calculate_by_digits method for PrimeCalculator."""
 
-    def test_calculate_by_digits_method_exists(self) -> None:
-        """Test that calculate_by_digits method exists."""
-        calc = PrimeCalculator()
-        assert hasattr(calc, 'calculate_by_digits')
-        assert callable(calc.calculate_by_digits)
-
-    def test_calculate_by_digits_one_digit(self) -> None:
+    def test_calculate_by_digits_one_digit(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test 1-digit prime returns 2 (first 1-digit prime)."""
-        calc = PrimeCalculator()
         result = calc.calculate_by_digits(1)
         assert result == 2
-        assert len(str(result)) == 1
+        assert 1 <= result < 10
 
-    def test_calculate_by_digits_two_digits(self) -> None:
+    def test_calculate_by_digits_two_digits(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test 2-digit prime returns 11 (first 2-digit prime)."""
-        calc = PrimeCalculator()
         result = calc.calculate_by_digits(2)
         assert result == 11
-        assert len(str(result)) == 2
+        assert 10 <= result < 100
 
-    def test_calculate_by_digits_three_digits(self) -> None:
+    def test_calculate_by_digits_three_digits(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test 3-digit prime returns 101 (first 3-digit prime)."""
-        calc = PrimeCalculator()
         result = calc.calculate_by_digits(3)
         assert result == 101
-        assert len(str(result)) == 3
+        assert 100 <= result < 1000
 
-    def test_calculate_by_digits_four_digits(self) -> None:
+    def test_calculate_by_digits_four_digits(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test 4-digit prime returns 1009 (first 4-digit prime)."""
-        calc = PrimeCalculator()
         result = calc.calculate_by_digits(4)
         assert result == 1009
-        assert len(str(result)) == 4
+        assert 1000 <= result < 10000
 
-    def test_calculate_by_digits_verifies_primality(self) -> None:
+    def test_calculate_by_digits_verifies_primality(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test that returned number is actually prime."""
-        calc = PrimeCalculator()
         for d in [1, 2, 3, 4]:
             result = calc.calculate_by_digits(d)
             msg = f"{result} should be prime"
             assert calc.miller_rabin(result), msg
 
-    def test_calculate_by_digits_negative_raises_error(self) -> None:
+    def test_calculate_by_digits_table_matches_search(
+        self, calc: PrimeCalculator
+    ) -> None:
+        """Test the lookup table agrees with the search past its end."""
+        assert calc.calculate_by_digits(18) == 100000000000000003
+        assert calc.calculate_by_digits(19) == 1000000000000000003
+
+    def test_calculate_by_digits_negative_raises_error(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test negative digit count raises InputError."""
-        calc = PrimeCalculator()
         with pytest.raises(InputError):
             calc.calculate_by_digits(-1)
 
-    def test_calculate_by_digits_zero_raises_error(self) -> None:
+    def test_calculate_by_digits_zero_raises_error(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test zero digit count raises InputError."""
-        calc = PrimeCalculator()
         with pytest.raises(InputError):
             calc.calculate_by_digits(0)
 
@@ -319,30 +467,34 @@ class TestPrimeCalculatorByDigits:
 class TestPrimeCalculatorResourceManager:
     """Test ResourceManager integration for PrimeCalculator."""
 
-    def test_calculate_by_index_has_decorators(self) -> None:
+    def test_calculate_by_index_has_decorators(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test calculate_by_index has monitor decorators."""
-        calc = PrimeCalculator()
         assert (
             hasattr(calc.calculate_by_index, '__wrapped__')
             or hasattr(calc.calculate_by_index, '__name__')
         )
 
-    def test_calculate_by_digits_has_decorators(self) -> None:
+    def test_calculate_by_digits_has_decorators(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test calculate_by_digits has monitor decorators."""
-        calc = PrimeCalculator()
         assert (
             hasattr(calc.calculate_by_digits, '__wrapped__')
             or hasattr(calc.calculate_by_digits, '__name__')
         )
 
-    def test_calculate_by_index_normal_execution(self) -> None:
+    def test_calculate_by_index_normal_execution(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test calculate_by_index works normally with decorators."""
-        calc = PrimeCalculator()
         result = calc.calculate_by_index(10)
         assert result == 29
 
-    def test_calculate_by_digits_normal_execution(self) -> None:
+    def test_calculate_by_digits_normal_execution(
+        self, calc: PrimeCalculator
+    ) -> None:
         """Test calculate_by_digits works normally with decorators."""
-        calc = PrimeCalculator()
         result = calc.calculate_by_digits(2)
         assert result == 11
@@ -4,17 +4,30 @@ This module contains tests for memory and timeout monitoring decorators,
 verifying resource limit enforcement and error handling.
 
 Dependencies:
+    - os: Current and parent process ids
+    - psutil: Process handle used by the RSS fallback
     - pytest: Testing framework
-    - time: Time measurement
+    - signal: Checking the timeout alarm is disarmed after a call
+    - threading: Holding monitored calls open and running them off the
+      main thread
+    - time: Timing one uninterruptible step to size the alarm interval
+    - types: Lightweight stand-in for psutil memory info
+    - typing: Type hints
     - unittest.mock: Mocking utilities
     - src.core.resource_manager: Monitoring decorators
     - src.core.exceptions: Resource exceptions
     - src.config: Configuration constants
 """
 
+import os
+import signal
+import threading
 import time
+from types import SimpleNamespace
+from typing import Optional, Type
 from unittest.mock import Mock, patch
 
+import psutil
 import pytest
 
 from src.config import MAX_MEMORY_BYTES, MAX_TIME_SECONDS
@@ -22,7 +35,40 @@ from src.core.exceptions import (
     ResourceExhaustedError,
     TimeoutError as CalculationTimeoutError,
 )
-from src.core.resource_manager import monitor_memory, monitor_timeout
+from src.core.resource_manager import (
+    _rss_bytes,
+    monitor_memory,
+    monitor_timeout,
+)
+
+
+def _completed() -> str:
+    """Return immediately, standing in for a finished calculation."""
+    return "completed"
+
+
+def _failing() -> None:
+    """Raise the error the exception-propagation tests expect."""
+    raise ValueError("Test error")
+
+
+# Decorated once at import so the tests share the same wrappers
+memory_completed = monitor_memory(_completed)
+memory_failing = monitor_memory(_failing)
+timeout_completed = monitor_timeout(_completed)
+timeout_failing = monitor_timeout(_failing)
+
+
+@monitor_memory
+def memory_documented() -> bool:
+    """This is a test function."""
+    return True
+
+
+@monitor_timeout
+def timeout_documented() -> bool:
+    """This is a test function."""
+    return True
 
 
 class TestMonitorMemory:
@@ -32,89 +78,67 @@ class TestMonitorMemory:
         """Test that monitor_memory decorator exists."""
         assert callable(monitor_memory)
 
-    def test_monitor_memory_allows_function_execution_under_limit(
-        self,
+    def test_monitor_memory_checks_once_after_execution(
+        self, mock_rss: Mock
     ) -> None:
-        """Test functions execute normally when memory is under limit."""
-        @monitor_memory
-        def simple_function() -> int:
-            return 42
-
-        with patch('psutil.Process.memory_info') as mock_memory:
-            mock_memory.return_value = Mock(rss=MAX_MEMORY_BYTES // 2)
-            result = simple_function()
-            assert result == 42
-
-    def test_monitor_memory_raises_error_when_exceeding_limit(
-        self,
-    ) -> None:
-        """Test ResourceExhaustedError raised when memory exceeds 24GB."""
-        @monitor_memory
-        def memory_intensive_function() -> str:
-            return "should not execute"
-
-        with patch('psutil.Process.memory_info') as mock_memory:
-            mock_memory.return_value = Mock(rss=MAX_MEMORY_BYTES + 1)
-            with pytest.raises(ResourceExhaustedError) as exc_info:
-                memory_intensive_function()
-            error_msg = str(exc_info.value).lower()
-            assert "memory" in error_msg or "24gb" in error_msg
-
-    def test_monitor_memory_checks_before_and_after_execution(
-        self,
-    ) -> None:
-        """Test memory is checked both before and after execution."""
-        call_count: list[str] = []
-
-        @monitor_memory
-        def tracked_function() -> str:
-            call_count.append("executed")
-            return "result"
-
-        with patch('psutil.Process.memory_info') as mock_memory:
-            mock_memory.return_value = Mock(rss=MAX_MEMORY_BYTES // 2)
-            result = tracked_function()
-            assert result == "result"
-            assert "executed" in call_count
-            assert mock_memory.called
+        """Test memory is checked a single time, after execution."""
+        assert memory_completed() == "completed"
+        assert mock_rss.call_count == 1
 
     def test_monitor_memory_preserves_function_metadata(self) -> None:
         """Test decorator preserves function name and docstring."""
-        @monitor_memory
-        def documented_function() -> bool:
-            """This is a test function."""
-            return True
-
-        assert documented_function.__name__ == "documented_function"
-        assert "test function" in documented_function.__doc__
+        assert memory_documented.__name__ == "memory_documented"
+        assert memory_documented.__doc__ is not None
+        assert "test function" in memory_documented.__doc__
 
+    @pytest.mark.usefixtures("mock_rss")
     def test_monitor_memory_handles_exceptions_during_execution(
         self,
     ) -> None:
         """Test memory monitoring works when function raises exception."""
-        @monitor_memory
-        def failing_function() -> None:
-            raise ValueError("Test error")
-
-        with patch('psutil.Process.memory_info') as mock_memory:
-            mock_memory.return_value = Mock(rss=MAX_MEMORY_BYTES // 2)
-            with pytest.raises(ValueError, match="Test error"):
-                failing_function()
-
-    def test_monitor_memory_exact_limit_boundary(self) -> None:
-        """Test behavior at exact memory limit boundary."""
-        @monitor_memory
-        def boundary_function() -> str:
-            return "at limit"
-
-        with patch('psutil.Process.memory_info') as mock_memory:
-            mock_memory.return_value = Mock(rss=MAX_MEMORY_BYTES)
-            result = boundary_function()
-            assert result == "at limit"
-
-            mock_memory.return_value = Mock(rss=MAX_MEMORY_BYTES + 1)
-            with pytest.raises(ResourceExhaustedError):
-                boundary_function()
+        with pytest.raises(ValueError, match="Test error"):
+            memory_failing()
+
+    def test_rss_fallback_follows_current_pid(self) -> None:
+        """Test the psutil fallback rebuilds its handle after a pid change."""
+        parent_pid = os.getppid()
+        with patch(
+            'src.core.resource_manager._HAS_STATM', False
+        ), patch.object(
+            psutil.Process,
+            'memory_info',
+            autospec=True,
+            side_effect=lambda process: SimpleNamespace(rss=process.pid),
+        ):
+            assert _rss_bytes() == os.getpid()
+            with patch(
+                'src.core.resource_manager.os.getpid', return_value=parent_pid
+            ):
+                assert _rss_bytes() == parent_pid
+
+    @pytest.mark.parametrize(
+        "rss, expected_error",
+        [
+            (MAX_MEMORY_BYTES // 2, None),
+            (MAX_MEMORY_BYTES, None),
+            (MAX_MEMORY_BYTES + 1, ResourceExhaustedError),
+        ],
+    )
+    def test_monitor_memory_limit_boundary(
+        self,
+        mock_rss: Mock,
+        rss: int,
+        expected_error: Optional[Type[Exception]],
+    ) -> None:
+        """Test calls pass up to the 24GB limit and fail just above it."""
+        mock_rss.return_value = rss
+        if expected_error is None:
+            assert memory_completed() == "completed"
+            return
+        with pytest.raises(expected_error) as exc_info:
+            memory_completed()
+        error_msg = str(exc_info.value).lower()
+        assert "memory" in error_msg or "24gb" in error_msg
 
 
 class TestMonitorTimeout:
@@ -128,35 +152,27 @@ class TestMonitorTimeout:
         self,
     ) -> None:
         """Test functions complete quickly without timeout."""
-        @monitor_timeout
-        def fast_function() -> str:
-            return "completed"
-
-        result = fast_function()
-        assert result == "completed"
+        assert timeout_completed() == "completed"
 
     def test_monitor_timeout_raises_error_when_exceeding_limit(
         self,
     ) -> None:
         """Test CalculationTimeoutError raised when function exceeds 300s."""
-        @monitor_timeout
-        def slow_function() -> str:
-            time.sleep(MAX_TIME_SECONDS + 1)
-            return "should not complete"
-
-        with patch('time.sleep'), patch('time.time') as mock_time:
-            start_time = 1000.0
+        with patch(
+            'src.core.resource_manager.time.monotonic_ns'
+        ) as mock_time:
+            start_ns = 1_000 * 10**9
             call_count = [0]
 
-            def time_side_effect() -> float:
+            def time_side_effect() -> int:
                 call_count[0] += 1
                 if call_count[0] == 1:
-                    return start_time
-                return start_time + MAX_TIME_SECONDS + 1
+                    return start_ns
+                return start_ns + (MAX_TIME_SECONDS + 1) * 10**9
 
             mock_time.side_effect = time_side_effect
             with pytest.raises(CalculationTimeoutError) as exc_info:
-                slow_function()
+                timeout_completed()
             error_msg = str(exc_info.value).lower()
             assert (
                 "timeout" in error_msg
@@ -166,53 +182,125 @@ class TestMonitorTimeout:
 
     def test_monitor_timeout_preserves_function_metadata(self) -> None:
         """Test decorator preserves function name and docstring."""
-        @monitor_timeout
-        def documented_function() -> bool:
-            """This is a test function."""
-            return True
-
-        assert documented_function.__name__ == "documented_function"
-        assert "test function" in documented_function.__doc__
+        assert timeout_documented.__name__ == "timeout_documented"
+        assert timeout_documented.__doc__ is not None
+        assert "test function" in timeout_documented.__doc__
 
     def test_monitor_timeout_handles_exceptions_during_execution(
         self,
     ) -> None:
         """Test timeout monitoring works when function raises exception."""
-        @monitor_timeout
-        def failing_function() -> None:
-            raise ValueError("Test error")
-
         with pytest.raises(ValueError, match="Test error"):
-            failing_function()
+            timeout_failing()
 
     def test_monitor_timeout_with_mocked_time(self) -> None:
         """Test timeout behavior using mocked time."""
-        @monitor_timeout
-        def timed_function() -> str:
-            return "result"
-
-        with patch('time.time') as mock_time:
-            start_time = 1000.0
+        with patch(
+            'src.core.resource_manager.time.monotonic_ns'
+        ) as mock_time:
+            start_ns = 1_000 * 10**9
             mock_time.side_effect = [
-                start_time,
-                start_time + MAX_TIME_SECONDS + 1,
+                start_ns,
+                start_ns + (MAX_TIME_SECONDS + 1) * 10**9,
             ]
             with pytest.raises(CalculationTimeoutError):
-                timed_function()
+                timeout_completed()
 
     def test_monitor_timeout_allows_function_just_under_limit(
         self,
     ) -> None:
         """Test function completes successfully just under timeout limit."""
-        @monitor_timeout
-        def near_limit_function() -> str:
-            return "completed"
-
-        with patch('time.time') as mock_time:
-            start_time = 1000.0
+        with patch(
+            'src.core.resource_manager.time.monotonic_ns'
+        ) as mock_time:
+            start_ns = 1_000 * 10**9
             mock_time.side_effect = [
-                start_time,
-                start_time + MAX_TIME_SECONDS - 1,
+                start_ns,
+                start_ns + (MAX_TIME_SECONDS - 1) * 10**9,
             ]
-            result = near_limit_function()
-            assert result == "completed"
+            assert timeout_completed() == "completed"
+
+    def test_monitor_timeout_samples_memory_while_running(
+        self, mock_rss: Mock
+    ) -> None:
+        """Test memory is sampled while a long calculation is running."""
+        release = threading.Event()
+
+        @monitor_timeout
+        def long_running_function() -> str:
+            release.wait(5)
+            return "should not be returned"
+
+        mock_rss.return_value = MAX_MEMORY_BYTES + 1
+        with patch('src.core.resource_manager.MEMORY_SAMPLE_SECONDS', 0.01):
+            try:
+                with pytest.raises(ResourceExhaustedError):
+                    long_running_function()
+            finally:
+                release.set()
+
+    @pytest.mark.skipif(
+        not hasattr(signal, 'setitimer'), reason="requires setitimer"
+    )
+    def test_monitor_timeout_interrupts_running_calculation(self) -> None:
+        """Test the timeout stops a calculation and disarms the alarm."""
+        release = threading.Event()
+        handler_before = signal.getsignal(signal.SIGALRM)
+
+        @monitor_timeout
+        def stuck_function() -> str:
+            release.wait(5)
+            return "should not be returned"
+
+        with patch(
+            'src.core.resource_manager.MAX_TIME_SECONDS', 0.05
+        ), patch('src.core.resource_manager.MEMORY_SAMPLE_SECONDS', 0.01):
+            try:
+                with pytest.raises(CalculationTimeoutError):
+                    stuck_function()
+            finally:
+                release.set()
+        assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+        assert signal.getsignal(signal.SIGALRM) is handler_before
+
+    @pytest.mark.skipif(
+        not hasattr(signal, 'setitimer'), reason="requires setitimer"
+    )
+    def test_monitor_timeout_deadline_survives_long_c_level_steps(
+        self,
+    ) -> None:
+        """Test the deadline holds when one C-level step spans many ticks.
+
+        Ticks expiring during a single ``sum(range(...))`` call merge into
+        one SIGALRM, so counting ticks would stop only after six steps.
+        """
+        start = time.perf_counter()
+        sum(range(5_000_000))
+        step_seconds = time.perf_counter() - start
+        steps: list[int] = []
+
+        @monitor_timeout
+        def chunked_function() -> str:
+            for _ in range(20):
+                sum(range(5_000_000))
+                steps.append(1)
+            return "should not be returned"
+
+        with patch(
+            'src.core.resource_manager.MAX_TIME_SECONDS', step_seconds * 1.5
+        ), patch(
+            'src.core.resource_manager.MEMORY_SAMPLE_SECONDS',
+            step_seconds / 4,
+        ), pytest.raises(CalculationTimeoutError):
+            chunked_function()
+        assert len(steps) <= 3
+
+    def test_monitor_timeout_runs_outside_main_thread(self) -> None:
+        """Test monitored calls still work from a worker thread."""
+        results: list[str] = []
+        worker = threading.Thread(
+            target=lambda: results.append(timeout_completed())
+        )
+        worker.start()
+        worker.join(5)
+        assert results == ["completed"]